@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import os
@@ -102,6 +103,43 @@ def filter_datas(start_date, end_date, datas):
     return datas
 
 
+# Last served /json body of every analytics file, one entry per file.
+# The ETag holds the file stat and the requested timeframe, so a change to either recomputes it
+response_cache = {}
+
+
+def dumps(datas):
+    return json.dumps(datas, separators=(",", ":"))
+
+
+def json_response(body, status=200, etag=None):
+    response = Response(body, status=status, mimetype="application/json")
+    if etag is not None:
+        response.set_etag(etag)
+    return response
+
+
+def not_modified(etag):
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def analytics_etag(streamers):
+    # Built from the files stat only, so the dashboard's If-None-Match is answered before any read
+    start_date = request.args.get("startDate", type=str)
+    end_date = request.args.get("endDate", type=str)
+    # Without an endDate the timeframe ends today, so the ETag has to roll over at midnight
+    if end_date is None:
+        end_date = datetime.now().strftime("%Y-%m-%d")
+
+    state = [request.path, start_date, end_date]
+    for streamer in streamers:
+        stat = os.stat(os.path.join(Settings.analytics_path, streamer))
+        state.append((streamer, stat.st_mtime_ns, stat.st_size))
+    return hashlib.sha1(repr(state).encode("utf-8")).hexdigest()
+
+
 def read_json(streamer, return_response=True):
     start_date = request.args.get("startDate", type=str)
     end_date = request.args.get("endDate", type=str)
@@ -109,62 +147,67 @@ def read_json(streamer, return_response=True):
     path = Settings.analytics_path
     streamer = streamer if streamer.endswith(".json") else f"{streamer}.json"
 
+    file_path = os.path.join(path, streamer)
+
     # Check if the file exists before attempting to read it
-    if not os.path.exists(os.path.join(path, streamer)):
+    if not os.path.exists(file_path):
         error_message = f"File '{streamer}' not found."
         logger.error(error_message)
         if return_response:
-            return Response(json.dumps({"error": error_message}), status=404, mimetype="application/json")
+            return json_response(dumps({"error": error_message}), status=404)
         else:
             return {"error": error_message}
 
+    if return_response:
+        etag = analytics_etag([streamer])
+        if request.if_none_match.contains(etag):
+            return not_modified(etag)
+        cached = response_cache.get(file_path)
+        if cached is not None and cached[0] == etag:
+            return json_response(cached[1], etag=etag)
+
     try:
-        with open(os.path.join(path, streamer), 'r') as file:
+        with open(file_path, 'r') as file:
             data = json.load(file)
     except json.JSONDecodeError as e:
         error_message = f"Error decoding JSON in file '{streamer}': {str(e)}"
         logger.error(error_message)
         if return_response:
-            return Response(json.dumps({"error": error_message}), status=500, mimetype="application/json")
+            return json_response(dumps({"error": error_message}), status=500)
         else:
             return {"error": error_message}
 
     # Handle filtering data, if applicable
     filtered_data = filter_datas(start_date, end_date, data)
     if return_response:
-        return Response(json.dumps(filtered_data), status=200, mimetype="application/json")
+        body = dumps(filtered_data)
+        response_cache[file_path] = (etag, body)
+        return json_response(body, etag=etag)
     else:
         return filtered_data
 
 
-def get_challenge_points(streamer):
+def get_last_serie(streamer):
     datas = read_json(streamer, return_response=False)
     if "series" in datas and datas["series"]:
-        return datas["series"][-1]["y"]
-    return 0  # Default value when 'series' key is not found or empty
-
-
-def get_last_activity(streamer):
-    datas = read_json(streamer, return_response=False)
-    if "series" in datas and datas["series"]:
-        return datas["series"][-1]["x"]
-    return 0  # Default value when 'series' key is not found or empty
+        return datas["series"][-1]
+    return {}  # No 'series' key or empty, callers fall back to 0 through .get
 
 
 def json_all():
-    return Response(
-        json.dumps(
-            [
-                {
-                    "name": streamer.strip(".json"),
-                    "data": read_json(streamer, return_response=False),
-                }
-                for streamer in streamers_available()
-            ]
-        ),
-        status=200,
-        mimetype="application/json",
-    )
+    available = streamers_available()
+    etag = analytics_etag(available)
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+    return json_response(dumps(
+        [
+            {
+                "name": streamer.strip(".json"),
+                "data": read_json(streamer, return_response=False),
+            }
+            for streamer in available
+        ]
+    ), etag=etag)
 
 
 def index(refresh=5, days_ago=7):
@@ -176,17 +219,19 @@ def index(refresh=5, days_ago=7):
 
 
 def streamers():
-    return Response(
-        json.dumps(
-            [
-                {"name": s, "points": get_challenge_points(
-                    s), "last_activity": get_last_activity(s)}
-                for s in sorted(streamers_available())
-            ]
-        ),
-        status=200,
-        mimetype="application/json",
-    )
+    available = sorted(streamers_available())
+    etag = analytics_etag(available)
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+    # Read and filter each analytics file once, instead of once per field
+    last_series = [(s, get_last_serie(s)) for s in available]
+    return json_response(dumps(
+        [
+            {"name": s, "points": serie.get("y", 0),
+             "last_activity": serie.get("x", 0)}
+            for s, serie in last_series
+        ]
+    ), etag=etag)
 
 
 def download_assets(assets_folder, required_files):
@@ -276,15 +321,18 @@ class AnalyticsServer(Thread):
             defaults={"refresh": refresh, "days_ago": days_ago},
             methods=["GET"],
         )
+        # The dashboard polls these routes; skip the automatic OPTIONS handling and slash redirects
+        polling_options = {"strict_slashes": False,
+                           "provide_automatic_options": False}
         self.app.add_url_rule("/streamers", "streamers",
-                              streamers, methods=["GET"])
+                              streamers, methods=["GET"], **polling_options)
         self.app.add_url_rule(
-            "/json/<string:streamer>", "json", read_json, methods=["GET"]
+            "/json/<string:streamer>", "json", read_json, methods=["GET"], **polling_options
         )
         self.app.add_url_rule("/json_all", "json_all",
-                              json_all, methods=["GET"])
+                              json_all, methods=["GET"], **polling_options)
         self.app.add_url_rule(
-            "/log", "log", generate_log, methods=["GET"])
+            "/log", "log", generate_log, methods=["GET"], **polling_options)
 
     def run(self):
         logger.info(